@@ -0,0 +1,230 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    print("Warning: psutil not available, RSS and CPU will not be measured")
+    PSUTIL_AVAILABLE = False
+
+from run_history import new_run_stats, percentile
+from standin_site import StandInSite, identity
+
+logger = logging.getLogger(__name__)
+
+SATURATION_GAIN = 0.10  # Throughput must grow by at least 10% per step to count as scaling
+SATURATION_LATENCY = 1.5  # Median latency may grow to 1.5x the lowest level before saturation
+
+class ResourceSampler(threading.Thread):
+    """Sample total RSS of this process tree and system CPU usage in the background"""
+
+    def __init__(self, interval):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.peak_rss = 0
+        self.cpu_samples = []
+
+    def run(self):
+        if not PSUTIL_AVAILABLE:
+            return
+        root = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        while not self.stop_event.wait(self.interval):
+            rss = 0
+            # Chrome runs as a child of chromedriver, which runs as a child of each worker
+            for process in [root] + root.children(recursive=True):
+                try:
+                    rss += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            self.peak_rss = max(self.peak_rss, rss)
+            self.cpu_samples.append(psutil.cpu_percent(interval=None))
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+def _warm_up_worker():
+    """Import the update flow so module import time is not counted as session latency"""
+    import resume_headline_sync  # noqa: F401
+    return os.getpid()
+
+def _run_session(index, verbose):
+    """Run the update flow once in a worker process with the given test identity"""
+    import resume_headline_sync
+    if not verbose:
+        logging.getLogger().setLevel(logging.CRITICAL)
+
+    run_stats = new_run_stats()
+    try:
+        resume_headline_sync.update_resume_headline(run_stats, identity(index))
+        run_stats['status'] = 'success'
+    except Exception as e:
+        run_stats['status'] = 'failed'
+        run_stats['error'] = str(e)
+    run_stats['total_duration'] = time.time() - run_stats['start_time']
+    return run_stats
+
+def _failed_session(error):
+    """Result for a session whose worker process died or could not be started"""
+    return {'status': 'failed', 'error': f"{type(error).__name__}: {error}", 'phases': {}}
+
+def run_level(concurrency, rounds, first_index, sample_interval, verbose, site):
+    """Run concurrency * rounds sessions with `concurrency` worker processes.
+
+    A worker that dies (for example Chrome being killed when memory runs
+    out breaks the whole pool) counts as failed sessions instead of
+    aborting the sweep.
+    """
+    sessions = concurrency * rounds
+    saves_before = site.saves
+    results = []
+    with ProcessPoolExecutor(max_workers=concurrency, mp_context=multiprocessing.get_context('spawn')) as pool:
+        try:
+            for future in [pool.submit(_warm_up_worker) for _ in range(concurrency)]:
+                future.result()
+        except Exception as e:
+            logger.warning(f"K={concurrency}: worker warm-up failed: {e}")
+
+        sampler = ResourceSampler(sample_interval)
+        sampler.start()
+        start = time.time()
+        futures = []
+        for i in range(sessions):
+            try:
+                futures.append(pool.submit(_run_session, first_index + i, verbose))
+            except Exception as e:
+                results.append(_failed_session(e))
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(_failed_session(e))
+        wall_time = time.time() - start
+        sampler.stop()
+
+    ok = [run for run in results if run['status'] == 'success']
+    latencies = [run['total_duration'] for run in ok]
+    errors = sorted({run['error'] for run in results if run['error']})
+    for error in errors:
+        logger.warning(f"K={concurrency}: session failed: {error}")
+
+    phases = {}
+    for run in ok:
+        for name, duration in run['phases'].items():
+            phases.setdefault(name, []).append(duration)
+
+    return {
+        'concurrency': concurrency,
+        'sessions': sessions,
+        'ok': len(ok),
+        'saved': site.saves - saves_before,
+        'wall_time': wall_time,
+        'throughput': len(ok) / wall_time * 60 if wall_time else 0.0,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p95': percentile(latencies, 95),
+        'peak_rss_mb': sampler.peak_rss / 1024 / 1024 if PSUTIL_AVAILABLE else None,
+        'cpu_avg': sum(sampler.cpu_samples) / len(sampler.cpu_samples) if sampler.cpu_samples else None,
+        'cpu_peak': max(sampler.cpu_samples) if sampler.cpu_samples else None,
+        'phases': {name: percentile(values, 50) for name, values in phases.items()},
+    }
+
+def find_saturation(levels):
+    """Return the first concurrency level at which the machine stops scaling, or None"""
+    if not levels:
+        return None
+    if levels[0]['ok'] < levels[0]['sessions']:
+        return levels[0]['concurrency'], "sessions already fail at the lowest level"
+    base_p50 = levels[0]['p50']
+    for previous, level in zip(levels, levels[1:]):
+        if level['ok'] < level['sessions']:
+            return level['concurrency'], "sessions started failing"
+        if level['throughput'] < previous['throughput'] * (1 + SATURATION_GAIN):
+            return level['concurrency'], "throughput stopped growing"
+        if base_p50 and level['p50'] and level['p50'] > base_p50 * SATURATION_LATENCY:
+            return level['concurrency'], "median latency grew past the lowest level"
+    return None
+
+def _cell(value, width, fmt):
+    return f"{value:{width}{fmt}}" if value is not None else f"{'-':>{width}}"
+
+def print_results(levels):
+    """Print the scaling table, per-phase medians and the saturation point"""
+    print()
+    print(f"{'K':>4}{'ok':>9}{'saved':>7}{'wall s':>9}{'sess/min':>10}{'p50 s':>8}{'p90 s':>8}"
+          f"{'p95 s':>8}{'RSS MB':>9}{'CPU% avg':>10}{'CPU% max':>10}")
+    for level in levels:
+        print(f"{level['concurrency']:>4}{level['ok']:>5}/{level['sessions']:<3}{level['saved']:>7}"
+              f"{level['wall_time']:9.1f}{level['throughput']:10.2f}{_cell(level['p50'], 8, '.1f')}"
+              f"{_cell(level['p90'], 8, '.1f')}{_cell(level['p95'], 8, '.1f')}"
+              f"{_cell(level['peak_rss_mb'], 9, '.0f')}{_cell(level['cpu_avg'], 10, '.0f')}"
+              f"{_cell(level['cpu_peak'], 10, '.0f')}")
+    print()
+
+    phase_names = []
+    for level in levels:
+        for name in level['phases']:
+            if name not in phase_names:
+                phase_names.append(name)
+    if phase_names:
+        print("Median phase duration per session (s):")
+        print(f"{'K':>4}" + "".join(f"{name:>15}" for name in phase_names))
+        for level in levels:
+            print(f"{level['concurrency']:>4}" + "".join(_cell(level['phases'].get(name), 15, '.2f') for name in phase_names))
+        print()
+
+    saturation = find_saturation(levels)
+    if saturation:
+        print(f"Saturation at K={saturation[0]}: {saturation[1]}")
+    else:
+        print("No saturation detected in the tested range")
+
+def run_benchmark(concurrency_levels, rounds, sample_interval, verbose=False):
+    """Sweep concurrent update sessions against a local stand-in site"""
+    if not concurrency_levels or min(concurrency_levels) < 1 or rounds < 1:
+        raise ValueError("concurrency levels and rounds must be at least 1")
+    levels = []
+    site = StandInSite().start()
+    overrides = {
+        'CI': 'true',  # Use the headless CI browser profile in every session
+        'NAUKRI_BASE_URL': site.url,
+        'SESSION_WARMUP_URL': f"{site.url}/",
+    }
+    saved_env = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+
+    try:
+        try:
+            # Download chromedriver once so workers do not race on the cache
+            from webdriver_manager.chrome import ChromeDriverManager
+            ChromeDriverManager().install()
+        except Exception as e:
+            logger.warning(f"Could not pre-install chromedriver: {e}")
+
+        next_index = 0
+        for concurrency in concurrency_levels:
+            logger.info(f"Running {concurrency * rounds} sessions with {concurrency} concurrent workers")
+            level = run_level(concurrency, rounds, next_index, sample_interval, verbose, site)
+            next_index += level['sessions']
+            levels.append(level)
+            logger.info(f"K={concurrency}: {level['ok']}/{level['sessions']} ok, "
+                        f"{level['throughput']:.2f} sessions/min")
+    finally:
+        site.stop()
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        # Print whatever was measured even if the sweep was interrupted
+        if levels:
+            print_results(levels)
+
+    return levels
@@ -0,0 +1,281 @@
+import logging
+import os
+import re
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from urllib.parse import urlparse
+
+import variables
+
+logger = logging.getLogger(__name__)
+
+OK = 'ok'
+WARN = 'warn'
+FAIL = 'fail'
+
+CHROME_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+# On Windows `chrome.exe --version` opens a browser window instead of printing
+# the version, so the installed version is read from the registry instead
+WINDOWS_CHROME_BINARIES = [
+    r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+    r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+]
+WINDOWS_CHROME_VERSION_KEY = r'Software\Google\Chrome\BLBeacon'
+
+REQUIRED_SELECTORS = [
+    'username_field', 'password_field', 'login_button', 'headline_section',
+    'headline_edit_button', 'headline_textarea', 'save_button'
+]
+
+# Expected type of every setting in variables.py
+CONFIG_SCHEMA = {
+    'CHROME_OPTIONS': dict,
+    'RUN_HEADLESS': bool,
+    'CHROME_VERSION_MAIN': int,
+    'NAUKRI_BASE_URL': str,
+    'NAUKRI_LOGIN_URL': str,
+    'NAUKRI_PROFILE_URL': str,
+    'SESSION_WARMUP_URL': str,
+    'WEBDRIVER_WAIT_TIME': (int, float),
+    'LOGIN_WAIT_TIME': (int, float),
+    'PAGE_LOAD_WAIT_TIME': (int, float),
+    'ANIMATION_WAIT_TIME': (int, float),
+    'INPUT_WAIT_TIME': (int, float),
+    'SELECTORS': dict,
+    'RESUME_HEADLINE': str,
+    'LOG_FORMAT': str,
+    'LOG_DATE_FORMAT': str,
+    'LOG_LEVEL': str,
+    'SCREENSHOT_DIR': str,
+    'RUN_HISTORY_DB': str,
+    'REPORT_WINDOW': int,
+    'REPORT_BASELINE': int,
+    'REGRESSION_THRESHOLD': (int, float),
+    'PREFLIGHT_TIMEOUT': (int, float),
+    'BENCHMARK_CONCURRENCY': list,
+    'BENCHMARK_ROUNDS': int,
+    'BENCHMARK_SAMPLE_INTERVAL': (int, float),
+}
+
+class PreflightError(Exception):
+    """Raised when one or more preflight checks fail"""
+
+def check_credentials(load_credentials):
+    """Make sure credentials can be loaded from the environment or .env file"""
+    try:
+        email, password = load_credentials()
+    except ValueError as e:
+        return FAIL, str(e), None
+    return OK, f"credentials found for {email[:3]}***", (email, password)
+
+def check_config():
+    """Validate the settings in variables.py against CONFIG_SCHEMA"""
+    problems = []
+    for name, expected in CONFIG_SCHEMA.items():
+        if not hasattr(variables, name):
+            problems.append(f"{name} is missing")
+            continue
+        value = getattr(variables, name)
+        # bool is a subclass of int, so reject it explicitly for numeric settings
+        if not isinstance(value, expected) or (expected != bool and isinstance(value, bool)):
+            problems.append(f"{name} has type {type(value).__name__}")
+
+    for name in ('WEBDRIVER_WAIT_TIME', 'LOGIN_WAIT_TIME', 'PAGE_LOAD_WAIT_TIME',
+                 'ANIMATION_WAIT_TIME', 'INPUT_WAIT_TIME', 'PREFLIGHT_TIMEOUT'):
+        value = getattr(variables, name, None)
+        if isinstance(value, (int, float)) and value < 0:
+            problems.append(f"{name} must not be negative")
+
+    for name in ('NAUKRI_LOGIN_URL', 'NAUKRI_PROFILE_URL'):
+        url = urlparse(str(getattr(variables, name, '')))
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            problems.append(f"{name} is not a valid http(s) URL")
+
+    selectors = getattr(variables, 'SELECTORS', {})
+    if isinstance(selectors, dict):
+        for key in REQUIRED_SELECTORS:
+            selector = selectors.get(key)
+            if not isinstance(selector, str) or not selector.strip():
+                problems.append(f"SELECTORS['{key}'] is missing or empty")
+            elif selector.count('[') != selector.count(']') or selector.count('(') != selector.count(')'):
+                problems.append(f"SELECTORS['{key}'] has unbalanced brackets")
+
+    if str(getattr(variables, 'LOG_LEVEL', '')).upper() not in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'):
+        problems.append("LOG_LEVEL is not a valid logging level")
+    if not str(getattr(variables, 'RESUME_HEADLINE', '')).strip():
+        problems.append("RESUME_HEADLINE is empty")
+
+    if problems:
+        return FAIL, "; ".join(problems), None
+    return OK, f"{len(CONFIG_SCHEMA)} settings valid", None
+
+def _major_version(output):
+    match = re.search(r'(\d+)\.\d+', output or '')
+    return int(match.group(1)) if match else None
+
+def _read_version(binary, timeout):
+    try:
+        result = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=timeout)
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def _read_windows_chrome_version():
+    import winreg
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(root, WINDOWS_CHROME_VERSION_KEY) as key:
+                return f"Google Chrome {winreg.QueryValueEx(key, 'version')[0]}"
+        except OSError:
+            continue
+    return None
+
+def find_chrome():
+    """Return the path of the installed Chrome binary, or None"""
+    if os.name == 'nt':
+        return next((path for path in WINDOWS_CHROME_BINARIES if os.path.isfile(path)), None)
+    for candidate in CHROME_BINARIES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    return None
+
+def check_chrome(use_undetected, timeout):
+    """Check Chrome is installed and compatible with the driver that will be used"""
+    chrome_path = find_chrome()
+    if not chrome_path:
+        return FAIL, "Chrome binary not found", None
+
+    if os.name == 'nt':
+        chrome_output = _read_windows_chrome_version()
+    else:
+        chrome_output = _read_version(chrome_path, timeout)
+    chrome_major = _major_version(chrome_output)
+    if chrome_major is None:
+        return WARN, f"found {chrome_path} but could not read its version", None
+
+    if use_undetected:
+        if chrome_major != variables.CHROME_VERSION_MAIN:
+            # The flow falls back to regular Chrome if undetected Chrome fails to start
+            return WARN, (f"Chrome {chrome_major} does not match CHROME_VERSION_MAIN="
+                          f"{variables.CHROME_VERSION_MAIN}; undetected Chrome will likely fall back"), None
+        return OK, f"{chrome_output} matches CHROME_VERSION_MAIN", None
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        return FAIL, f"could not install chromedriver: {e}", None
+
+    driver_major = _major_version(_read_version(driver_path, timeout))
+    if driver_major is None:
+        return WARN, f"{chrome_output}; could not read chromedriver version", None
+    if driver_major != chrome_major:
+        return FAIL, f"chromedriver {driver_major} is incompatible with Chrome {chrome_major}", None
+    return OK, f"{chrome_output} with chromedriver {driver_major}", None
+
+def check_host(host, port, timeout):
+    """Resolve a host and open a TCP connection to any of its addresses"""
+    start = time.time()
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            address = sock.getpeername()[0]
+    except socket.gaierror as e:
+        return FAIL, f"DNS lookup failed: {e}", None
+    except OSError as e:
+        return FAIL, f"TCP connect to {host}:{port} failed: {e}", None
+    return OK, f"{address}:{port} reachable in {(time.time() - start) * 1000:.0f}ms", None
+
+def check_writable(directory):
+    """Create a directory if needed and verify files can be written to it"""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory):
+            pass
+    except OSError as e:
+        return FAIL, f"not writable: {e}", None
+    return OK, f"{os.path.abspath(directory)} writable", None
+
+def build_checks(load_credentials, use_undetected):
+    """Return the preflight checks as a mapping of name to callable"""
+    timeout = variables.PREFLIGHT_TIMEOUT
+    checks = {
+        'credentials': lambda: check_credentials(load_credentials),
+        'config': check_config,
+        'chrome': lambda: check_chrome(use_undetected, timeout),
+        'screenshot dir': lambda: check_writable(variables.SCREENSHOT_DIR),
+        'state dir': lambda: check_writable(os.path.dirname(variables.RUN_HISTORY_DB) or '.'),
+    }
+
+    hosts = []
+    for url in (variables.NAUKRI_LOGIN_URL, variables.NAUKRI_PROFILE_URL):
+        parsed = urlparse(url)
+        port = parsed.port or (80 if parsed.scheme == 'http' else 443)
+        if parsed.hostname and (parsed.hostname, port) not in hosts:
+            hosts.append((parsed.hostname, port))
+    for host, port in hosts:
+        checks[f"reach {host}:{port}"] = lambda host=host, port=port: check_host(host, port, timeout)
+    return checks
+
+def _start_check(check):
+    """Run a check in a daemon thread and return a Future for its result.
+
+    Daemon threads are used instead of a ThreadPoolExecutor, whose workers
+    are joined at interpreter exit, so a hung DNS lookup or download cannot
+    keep the process alive after preflight has given up on it.
+    """
+    future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(check())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+def run_preflight(load_credentials, use_undetected):
+    """Run all preflight checks concurrently and report the results together.
+
+    Every check must finish within PREFLIGHT_TIMEOUT seconds of the start of
+    the stage, otherwise it is reported as failed. Returns the loaded
+    (email, password) tuple. Raises PreflightError listing every failed
+    check if any of them fail.
+    """
+    checks = build_checks(load_credentials, use_undetected)
+    logger.info(f"Running {len(checks)} preflight checks")
+    start = time.time()
+    deadline = start + variables.PREFLIGHT_TIMEOUT
+
+    futures = {name: _start_check(check) for name, check in checks.items()}
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result(timeout=max(0, deadline - time.time()))
+        except FutureTimeoutError:
+            results[name] = (FAIL, f"timed out after {variables.PREFLIGHT_TIMEOUT}s", None)
+        except Exception as e:
+            results[name] = (FAIL, f"unexpected error: {e}", None)
+
+    elapsed = time.time() - start
+    logger.info(f"Preflight report ({elapsed:.2f}s):")
+    for name, (status, message, _) in results.items():
+        log = logger.error if status == FAIL else logger.warning if status == WARN else logger.info
+        log(f"  [{status.upper():4}] {name}: {message}")
+
+    failed = [name for name, (status, _, _) in results.items() if status == FAIL]
+    if failed:
+        raise PreflightError(f"Preflight failed: {', '.join(failed)}")
+    return results['credentials'][2]
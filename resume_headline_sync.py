@@ -29,7 +29,9 @@ except ImportError:
     USER_AGENT_AVAILABLE = False
 
 from dotenv import load_dotenv
+import argparse
 import os
+import sys
 import time
 import random
 from datetime import datetime
@@ -39,8 +41,13 @@ from variables import (
     WEBDRIVER_WAIT_TIME, LOGIN_WAIT_TIME, PAGE_LOAD_WAIT_TIME,
     ANIMATION_WAIT_TIME, INPUT_WAIT_TIME, SELECTORS,
     RESUME_HEADLINE, LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT,
-    RUN_HEADLESS
+    RUN_HEADLESS, RUN_HISTORY_DB, REPORT_WINDOW, REPORT_BASELINE,
+    REGRESSION_THRESHOLD, CHROME_VERSION_MAIN, SCREENSHOT_DIR,
+    SESSION_WARMUP_URL, BENCHMARK_CONCURRENCY, BENCHMARK_ROUNDS,
+    BENCHMARK_SAMPLE_INTERVAL
 )
+from run_history import new_run_stats, mark_phase, record_run, print_report
+from preflight import run_preflight, PreflightError
 
 # Configure logging
 logging.basicConfig(
@@ -114,8 +121,15 @@ def load_credentials():
         logger.info("2. Set environment variables: export NAUKRI_EMAIL='...' && export NAUKRI_PASSWORD='...'")
         raise ValueError("Please set NAUKRI_EMAIL and NAUKRI_PASSWORD in environment variables or .env file")
 
-def update_resume_headline():
-    """Update the resume headline on Naukri profile"""
+def update_resume_headline(run_stats=None, credentials=None):
+    """Update the resume headline on Naukri profile.
+
+    If credentials is None they are loaded after the browser has started;
+    pass the (email, password) returned by preflight to avoid that.
+    """
+    if run_stats is None:
+        run_stats = new_run_stats()
+    phase_start = time.time()
     logger.info("=== Starting Naukri Resume Headline Update ===")
     
     # Log the headline that will be used
@@ -126,6 +140,7 @@ def update_resume_headline():
     
     # Check if running in CI environment
     is_ci = os.getenv('CI', 'false').lower() == 'true'
+    run_stats['profile'] = 'ci' if is_ci else 'local'
     
     # Check availability of undetected chrome for this session
     uc_available_local = UC_AVAILABLE
@@ -169,6 +184,7 @@ def update_resume_headline():
         options.add_experimental_option("prefs", prefs)
         
         logger.info("Initializing Chrome browser for CI environment")
+        run_stats['backend'] = 'selenium'
         driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
         
         # Enhanced anti-bot scripts for CI
@@ -188,9 +204,9 @@ def update_resume_headline():
             });
         """)
         
-        # Visit Google first to build session history
+        # Visit a search page first to build session history
         logger.info("Building session history...")
-        driver.get('https://www.google.com')
+        driver.get(SESSION_WARMUP_URL)
         time.sleep(random.uniform(2, 4))
         
         # Search for something to make it look more natural
@@ -255,9 +271,8 @@ def update_resume_headline():
                 else:
                     logger.info("Running in visible mode (not headless)")
                 
-                # Get Chrome major version
-                chrome_version = 139  # Set to your current Chrome version
-                driver = uc.Chrome(options=options, version_main=chrome_version)  # Use specific version
+                driver = uc.Chrome(options=options, version_main=CHROME_VERSION_MAIN)  # Use specific version
+                run_stats['backend'] = 'undetected'
                 logger.info("Successfully initialized undetected Chrome")
                 
             except Exception as e:
@@ -290,6 +305,7 @@ def update_resume_headline():
                 chrome_options.add_argument('--headless')
             
             driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+            run_stats['backend'] = 'selenium'
             
             # Add anti-bot scripts for regular Chrome
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -311,10 +327,11 @@ def update_resume_headline():
     time.sleep(random.uniform(1, 3))
     
     logger.info("Chrome browser initialized successfully with anti-bot measures")
+    phase_start = mark_phase(run_stats, 'browser_setup', phase_start)
     
     try:
         # Load credentials and login
-        email, password = load_credentials()
+        email, password = credentials if credentials else load_credentials()
         driver.get(NAUKRI_LOGIN_URL)
         
         # Login with human-like behavior
@@ -397,6 +414,7 @@ def update_resume_headline():
         
         # Add random delay after login attempt
         time.sleep(random.uniform(2.0, 4.0))
+        phase_start = mark_phase(run_stats, 'login', phase_start)
         
         # Check for CAPTCHA or other challenges
         logger.info("Checking for CAPTCHA or login challenges...")
@@ -426,6 +444,7 @@ def update_resume_headline():
                 captcha_element = driver.find_element(By.XPATH, selector)
                 if captcha_element.is_displayed():
                     captcha_detected = True
+                    run_stats['captcha_selector'] = selector
                     logger.warning(f"CAPTCHA detected with selector: {selector}")
                     break
             except:
@@ -446,6 +465,7 @@ def update_resume_headline():
                 error_element = driver.find_element(By.XPATH, selector)
                 if error_element.is_displayed():
                     login_error = True
+                    run_stats['login_error_selector'] = selector
                     logger.warning(f"Login error detected: {error_element.text}")
                     break
             except:
@@ -519,7 +539,7 @@ def update_resume_headline():
                         logger.error("CAPTCHA blocking access - profile page not accessible")
                         # Take screenshot for debugging
                         try:
-                            driver.save_screenshot("screenshots/captcha_blocked.png")
+                            driver.save_screenshot(os.path.join(SCREENSHOT_DIR, "captcha_blocked.png"))
                             logger.info("Screenshot saved: captcha_blocked.png")
                         except:
                             pass
@@ -544,6 +564,8 @@ def update_resume_headline():
         except TimeoutException:
             logger.warning("Login may not have completed - URL didn't change")
         
+        phase_start = mark_phase(run_stats, 'login_check', phase_start)
+        
         # Navigate to profile page
         logger.info("Navigating to Naukri profile page")
         driver.get(NAUKRI_PROFILE_URL)
@@ -573,6 +595,7 @@ def update_resume_headline():
                     EC.presence_of_element_located((By.XPATH, SELECTORS['headline_section'])))
             
             logger.info("Successfully located headline section")
+            phase_start = mark_phase(run_stats, 'profile_load', phase_start)
         except TimeoutException as e:
             logger.error("Could not locate headline section")
             raise Exception("Failed to access profile page") from e
@@ -646,6 +669,7 @@ def update_resume_headline():
                 except (ElementNotInteractableException, StaleElementReferenceException) as e:
                     if attempt == retry_count - 1:
                         raise e
+                    run_stats['retries'] += 1
                     logger.warning(f"Clear attempt {attempt + 1} failed, retrying...")
                     time.sleep(INPUT_WAIT_TIME)
             
@@ -675,6 +699,7 @@ def update_resume_headline():
                 except (ElementNotInteractableException, StaleElementReferenceException) as e:
                     if attempt == retry_count - 1:
                         raise e
+                    run_stats['retries'] += 1
                     logger.warning(f"Text entry attempt {attempt + 1} failed, retrying...")
                     time.sleep(INPUT_WAIT_TIME)
             
@@ -686,6 +711,8 @@ def update_resume_headline():
             logger.error(f"Error updating headline text: {str(e)}")
             raise
             
+        phase_start = mark_phase(run_stats, 'headline_edit', phase_start)
+        
         # Save changes
         logger.info("Looking for Save button")
         time.sleep(ANIMATION_WAIT_TIME)
@@ -704,6 +731,7 @@ def update_resume_headline():
             # Click save button once and exit immediately
             save_button.click()
             logger.info("Save button clicked")
+            phase_start = mark_phase(run_stats, 'save', phase_start)
             
             # Exit immediately after clicking save
             success_message = f"Update completed at {datetime.now()}"
@@ -741,5 +769,99 @@ def update_resume_headline():
         finally:
             logger.info("=== Resume headline update completed ===\n")
 
+def preflight():
+    """Validate credentials, config, Chrome, network and directories before launching the browser"""
+    is_ci = os.getenv('CI', 'false').lower() == 'true'
+    return run_preflight(load_credentials, use_undetected=UC_AVAILABLE and not is_ci)
+
+def run_and_record():
+    """Run the headline update and append the outcome to the run history"""
+    run_stats = new_run_stats()
+    try:
+        phase_start = time.time()
+        try:
+            credentials = preflight()
+        finally:
+            mark_phase(run_stats, 'preflight', phase_start)
+        update_resume_headline(run_stats, credentials)
+        run_stats['status'] = 'success'
+    except PreflightError as e:
+        run_stats['status'] = 'preflight_failed'
+        run_stats['error'] = str(e)
+        raise
+    except Exception as e:
+        run_stats['status'] = 'failed'
+        run_stats['error'] = str(e)
+        raise
+    finally:
+        record_run(RUN_HISTORY_DB, run_stats)
+
+def positive_int(value):
+    """argparse type for integers of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def non_negative_int(value):
+    """argparse type for integers of at least 0"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return number
+
+def non_negative_float(value):
+    """argparse type for numbers of at least 0"""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return number
+
+def main():
+    parser = argparse.ArgumentParser(description="Update the Naukri resume headline")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('run', help="Update the resume headline (default)")
+    subparsers.add_parser('preflight', help="Run the preflight checks without launching the browser")
+    benchmark_parser = subparsers.add_parser('benchmark',
+                                             help="Measure concurrent sessions against a local stand-in site")
+    benchmark_parser.add_argument('--concurrency', type=positive_int, nargs='+', default=BENCHMARK_CONCURRENCY,
+                                  help="Numbers of concurrent sessions to sweep")
+    benchmark_parser.add_argument('--rounds', type=positive_int, default=BENCHMARK_ROUNDS,
+                                  help="Sessions per worker at each concurrency level")
+    benchmark_parser.add_argument('--verbose', action='store_true', help="Show logs from the update sessions")
+    report_parser = subparsers.add_parser('report', help="Print run history percentiles and trends")
+    report_parser.add_argument('--db', default=RUN_HISTORY_DB, help="Path to the run history database")
+    report_parser.add_argument('--window', type=positive_int, default=REPORT_WINDOW,
+                               help="Number of most recent runs to report on")
+    report_parser.add_argument('--baseline', type=non_negative_int, default=REPORT_BASELINE,
+                               help="Number of runs before the window used as baseline")
+    report_parser.add_argument('--threshold', type=non_negative_float, default=REGRESSION_THRESHOLD,
+                               help="Allowed relative slowdown of the median before failing (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    if args.command == 'report':
+        sys.exit(print_report(args.db, args.window, args.baseline, args.threshold))
+
+    if args.command == 'benchmark':
+        # Imported here so normal runs do not load the stand-in site or psutil
+        from benchmark import run_benchmark
+        run_benchmark(sorted(set(args.concurrency)), args.rounds, BENCHMARK_SAMPLE_INTERVAL, args.verbose)
+        return
+
+    if args.command == 'preflight':
+        try:
+            preflight()
+        except PreflightError as e:
+            logger.error(str(e))
+            sys.exit(1)
+        return
+
+    try:
+        run_and_record()
+    except PreflightError as e:
+        # The consolidated preflight report has already been logged
+        logger.error(str(e))
+        sys.exit(1)
+
 if __name__ == "__main__":
-    update_resume_headline()
+    main()
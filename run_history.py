@@ -0,0 +1,211 @@
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    profile TEXT,
+    backend TEXT,
+    retries INTEGER NOT NULL DEFAULT 0,
+    captcha_selector TEXT,
+    login_error_selector TEXT,
+    total_duration REAL,
+    phases TEXT NOT NULL DEFAULT '{}'
+)
+"""
+
+# Exit statuses of the report subcommand
+REPORT_OK = 0
+REPORT_REGRESSION = 1
+REPORT_UNREADABLE = 2
+
+def new_run_stats():
+    """Create an empty record for the current run"""
+    return {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'start_time': time.time(),
+        'status': 'unknown',
+        'error': None,
+        'profile': None,
+        'backend': None,
+        'retries': 0,
+        'captcha_selector': None,
+        'login_error_selector': None,
+        'phases': {},
+    }
+
+def mark_phase(run_stats, name, phase_start):
+    """Store the duration of a finished phase and return the start time of the next one"""
+    now = time.time()
+    run_stats['phases'][name] = round(now - phase_start, 3)
+    return now
+
+def connect(db_path):
+    """Open the history database, creating the schema if needed"""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute(SCHEMA)
+    return conn
+
+def record_run(db_path, run_stats):
+    """Append a finished run to the history database"""
+    total_duration = round(time.time() - run_stats['start_time'], 3)
+    try:
+        with contextlib.closing(connect(db_path)) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT INTO runs (started_at, status, error, profile, backend, retries, "
+                    "captcha_selector, login_error_selector, total_duration, phases) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run_stats['started_at'], run_stats['status'], run_stats['error'],
+                        run_stats['profile'], run_stats['backend'], run_stats['retries'],
+                        run_stats['captcha_selector'], run_stats['login_error_selector'],
+                        total_duration, json.dumps(run_stats['phases']),
+                    )
+                )
+        logger.info(f"Run recorded in history database {db_path} ({run_stats['status']}, {total_duration:.1f}s)")
+    except (sqlite3.Error, OSError) as e:
+        # History is diagnostic only - never fail the update because of it
+        logger.warning(f"Could not record run in history database: {e}")
+
+def load_runs(db_path, limit):
+    """Load the most recent runs, oldest first"""
+    if not os.path.exists(db_path):
+        return []
+    with contextlib.closing(connect(db_path)) as conn:
+        rows = conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+    runs = []
+    for row in reversed(rows):
+        run = dict(row)
+        run['phases'] = json.loads(run['phases'] or '{}')
+        runs.append(run)
+    return runs
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def _format_seconds(value):
+    return f"{value:8.2f}" if value is not None else f"{'-':>8}"
+
+def _format_change(recent, baseline):
+    if recent is None or not baseline:
+        return f"{'-':>8}"
+    return f"{(recent - baseline) / baseline * 100:+7.1f}%"
+
+def _rate(runs, predicate):
+    if not runs:
+        return 0.0
+    return sum(1 for run in runs if predicate(run)) / len(runs) * 100
+
+def print_report(db_path, window, baseline_size, threshold):
+    """Print percentiles and trends for recent runs.
+
+    The last `window` runs are compared against the `baseline_size` runs
+    before them. Returns REPORT_REGRESSION if the median total duration of
+    recent successful runs regressed by more than `threshold` over the
+    baseline, REPORT_UNREADABLE if the database cannot be read and
+    REPORT_OK otherwise.
+    """
+    if window < 1 or baseline_size < 0 or threshold < 0:
+        raise ValueError("window must be at least 1 and baseline and threshold must not be negative")
+    try:
+        runs = load_runs(db_path, window + baseline_size)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Could not read run history {db_path}: {e}")
+        return REPORT_UNREADABLE
+    if not runs:
+        print(f"No runs recorded in {db_path}")
+        return REPORT_OK
+
+    recent = runs[-window:]
+    baseline = runs[:-window]
+    recent_ok = [run for run in recent if run['status'] == 'success']
+    baseline_ok = [run for run in baseline if run['status'] == 'success']
+
+    print(f"Run history: {db_path}")
+    print(f"Recent window: {len(recent)} runs ({recent[0]['started_at']} .. {recent[-1]['started_at']})")
+    print(f"Baseline: {len(baseline)} runs before the window")
+    print()
+
+    phase_names = []
+    for run in runs:
+        for name in run['phases']:
+            if name not in phase_names:
+                phase_names.append(name)
+
+    print(f"{'metric':<20}{'p50':>8}{'p90':>8}{'p95':>8}{'max':>8}{'base p50':>10}{'change':>9}")
+    rows = [('total', lambda run: run['total_duration'])]
+    rows += [(name, lambda run, name=name: run['phases'].get(name)) for name in phase_names]
+    for label, getter in rows:
+        values = [getter(run) for run in recent_ok if getter(run) is not None]
+        base_values = [getter(run) for run in baseline_ok if getter(run) is not None]
+        base_median = percentile(base_values, 50)
+        print(
+            f"{label:<20}{_format_seconds(percentile(values, 50))}{_format_seconds(percentile(values, 90))}"
+            f"{_format_seconds(percentile(values, 95))}{_format_seconds(max(values) if values else None)}"
+            f"  {_format_seconds(base_median)}{_format_change(percentile(values, 50), base_median)}"
+        )
+    print()
+
+    print(f"{'rate (%)':<20}{'recent':>8}{'base':>8}")
+    rates = [
+        ('failure', lambda run: run['status'] != 'success'),
+        ('captcha', lambda run: run['captcha_selector'] is not None),
+        ('login error', lambda run: run['login_error_selector'] is not None),
+        ('retried', lambda run: run['retries'] > 0),
+    ]
+    for label, predicate in rates:
+        base_rate = f"{_rate(baseline, predicate):8.1f}" if baseline else f"{'-':>8}"
+        print(f"{label:<20}{_rate(recent, predicate):8.1f}{base_rate}")
+    print()
+
+    backends = {}
+    for run in recent:
+        key = f"{run['profile'] or '?'}/{run['backend'] or '?'}"
+        backends[key] = backends.get(key, 0) + 1
+    print("Profile/backend: " + ", ".join(f"{key} x{count}" for key, count in sorted(backends.items())))
+
+    selectors = {}
+    for run in recent:
+        for selector in (run['captcha_selector'], run['login_error_selector']):
+            if selector:
+                selectors[selector] = selectors.get(selector, 0) + 1
+    for selector, count in sorted(selectors.items(), key=lambda item: -item[1]):
+        print(f"  matched x{count}: {selector}")
+    print()
+
+    recent_median = percentile([run['total_duration'] for run in recent_ok], 50)
+    baseline_median = percentile([run['total_duration'] for run in baseline_ok], 50)
+    if recent_median is None or baseline_median is None:
+        print("Not enough successful runs to compare against the baseline")
+        return REPORT_OK
+
+    limit = baseline_median * (1 + threshold)
+    if recent_median > limit:
+        print(f"REGRESSION: recent median {recent_median:.2f}s exceeds baseline median "
+              f"{baseline_median:.2f}s by more than {threshold * 100:.0f}%")
+        return REPORT_REGRESSION
+
+    print(f"OK: recent median {recent_median:.2f}s within {threshold * 100:.0f}% of baseline median {baseline_median:.2f}s")
+    return REPORT_OK
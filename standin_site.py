@@ -0,0 +1,169 @@
+import html
+import logging
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+# Pages mirror the paths and markup targeted by SELECTORS in variables.py.
+# Avoid words matched by the CAPTCHA and login-error selectors in the flow
+# (verify, robot, security, invalid, error, ...) on pages that should pass.
+
+SEARCH_PAGE = """<html><body>
+<form action="/search" method="get"><input type="text" name="q"></form>
+</body></html>"""
+
+RESULTS_PAGE = """<html><body><p>Results for {query}</p></body></html>"""
+
+LOGIN_PAGE = """<html><body>
+{message}
+<form action="/nlogin/login" method="post">
+  <input type="text" id="usernameField" name="username">
+  <input type="password" id="passwordField" name="password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+HOME_PAGE = """<html><body><p>Welcome back</p><a href="/mnjuser/profile">Profile</a></body></html>"""
+
+LOGGED_OUT_PROFILE_PAGE = """<html><body><button onclick="location.href='/nlogin/login'">Login</button></body></html>"""
+
+PROFILE_PAGE = """<html><body>
+<div style="height: 600px"></div>
+<div class="widgetHead resumeHeadline">
+  <span class="widgetTitle">Resume headline</span>
+  <span class="edit icon" onclick="document.getElementById('dialog').style.display='block'">edit</span>
+  <p>{headline}</p>
+</div>
+<div id="dialog" class="ltCont" style="display: none">
+  <form action="/mnjuser/profile/headline" method="post">
+    <textarea name="headline" rows="4" cols="80">{headline}</textarea>
+    <button type="submit">Save</button>
+  </form>
+</div>
+<div style="height: 600px"></div>
+</body></html>"""
+
+def identity(index):
+    """Return the (email, password) of the stand-in test identity with the given index"""
+    return f"bench-user-{index}@example.com", f"bench-password-{index}"
+
+class StandInSite:
+    """Local HTTP server imitating the Naukri login and profile pages.
+
+    Accepts any identity produced by identity() and keeps one resume headline
+    per account, so concurrent sessions do not interfere with each other.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.headlines = {}
+        self.saves = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Stand-in site running at {self.url}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _send(self, body, status=200, headers=None):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _redirect(self, location, headers=None):
+                headers = dict(headers or {})
+                headers['Location'] = location
+                self._send('', status=303, headers=headers)
+
+            def _form(self):
+                length = int(self.headers.get('Content-Length', 0))
+                fields = parse_qs(self.rfile.read(length).decode('utf-8'))
+                return {name: values[0] for name, values in fields.items()}
+
+            def _user(self):
+                cookie = SimpleCookie(self.headers.get('Cookie', ''))
+                if 'session' not in cookie:
+                    return None
+                with site.lock:
+                    return site.sessions.get(cookie['session'].value)
+
+            def do_GET(self):
+                path, _, query = self.path.partition('?')
+                if path == '/':
+                    self._send(SEARCH_PAGE)
+                elif path == '/search':
+                    terms = parse_qs(query).get('q', [''])[0]
+                    self._send(RESULTS_PAGE.format(query=html.escape(terms)))
+                elif path == '/nlogin/login':
+                    self._send(LOGIN_PAGE.format(message=''))
+                elif path == '/mnjuser/homepage':
+                    self._send(HOME_PAGE)
+                elif path == '/mnjuser/profile':
+                    user = self._user()
+                    if not user:
+                        self._send(LOGGED_OUT_PROFILE_PAGE)
+                        return
+                    with site.lock:
+                        headline = site.headlines.get(user, '')
+                    self._send(PROFILE_PAGE.format(headline=html.escape(headline)))
+                else:
+                    self._send('<html><body>Not found</body></html>', status=404)
+
+            def do_POST(self):
+                if self.path == '/nlogin/login':
+                    form = self._form()
+                    email = form.get('username', '')
+                    index = email[len('bench-user-'):].split('@')[0]
+                    if not index.isdigit() or identity(int(index)) != (email, form.get('password')):
+                        message = '<div class="error">Invalid username or password</div>'
+                        self._send(LOGIN_PAGE.format(message=message), status=401)
+                        return
+                    token = secrets.token_hex(16)
+                    with site.lock:
+                        site.sessions[token] = email
+                    self._redirect('/mnjuser/homepage', {'Set-Cookie': f'session={token}; Path=/'})
+                elif self.path == '/mnjuser/profile/headline':
+                    user = self._user()
+                    if not user:
+                        self._redirect('/nlogin/login')
+                        return
+                    headline = self._form().get('headline', '')
+                    with site.lock:
+                        site.headlines[user] = headline
+                        site.saves += 1
+                    self._redirect('/mnjuser/profile')
+                else:
+                    self._send('<html><body>Not found</body></html>', status=404)
+
+        return Handler
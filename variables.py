@@ -1,3 +1,5 @@
+import os
+
 # Chrome options
 CHROME_OPTIONS = {
     'start_maximized': '--start-maximized',
@@ -10,10 +12,13 @@ CHROME_OPTIONS = {
 
 # Browser settings
 RUN_HEADLESS = True  # Set to False to see the browser window
+CHROME_VERSION_MAIN = 139  # Major version of the installed Chrome, used by undetected Chrome
 
-# URLs
-NAUKRI_LOGIN_URL = 'https://www.naukri.com/nlogin/login'
-NAUKRI_PROFILE_URL = 'https://www.naukri.com/mnjuser/profile'
+# URLs (NAUKRI_BASE_URL can be overridden to point at a local stand-in site)
+NAUKRI_BASE_URL = os.getenv('NAUKRI_BASE_URL', 'https://www.naukri.com')
+NAUKRI_LOGIN_URL = f'{NAUKRI_BASE_URL}/nlogin/login'
+NAUKRI_PROFILE_URL = f'{NAUKRI_BASE_URL}/mnjuser/profile'
+SESSION_WARMUP_URL = os.getenv('SESSION_WARMUP_URL', 'https://www.google.com')  # Visited first in CI to build session history
 
 # WebDriver wait time (in seconds)
 WEBDRIVER_WAIT_TIME = 30
@@ -42,3 +47,20 @@ RESUME_HEADLINE = """Senior DevOps Engineer | DevSecOps Expert with 6+ Years in
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 LOG_LEVEL = 'INFO'
+
+# Run history
+RUN_HISTORY_DB = 'run_history.db'
+REPORT_WINDOW = 10  # Number of most recent runs reported on
+REPORT_BASELINE = 30  # Number of runs before the window used as baseline
+REGRESSION_THRESHOLD = 0.25  # Fail the report if the recent median is 25% slower than baseline
+
+# Directories
+SCREENSHOT_DIR = 'screenshots'
+
+# Preflight
+PREFLIGHT_TIMEOUT = 30  # Seconds each preflight check may take (including a chromedriver download) before it fails
+
+# Benchmark
+BENCHMARK_CONCURRENCY = [1, 2, 4, 6, 8]  # Numbers of concurrent sessions to sweep
+BENCHMARK_ROUNDS = 1  # Sessions per worker at each concurrency level
+BENCHMARK_SAMPLE_INTERVAL = 0.5  # Seconds between RSS/CPU samples